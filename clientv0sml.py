@@ -1,16 +1,16 @@
 import pygame
 import sys
 import math
-import random
+import numpy as np
+
+import physics
 
 # Initialize pygame
 pygame.init()
 
-# Game Boy screen dimensions and scale
+# Game Boy screen dimensions, SDL scales the window up for modern displays
 GB_WIDTH, GB_HEIGHT = 160, 144
-SCALE = 4  # Scale up for modern displays
-WIDTH, HEIGHT = GB_WIDTH * SCALE, GB_HEIGHT * SCALE
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+screen = pygame.display.set_mode((GB_WIDTH, GB_HEIGHT), pygame.SCALED | pygame.RESIZABLE, vsync=1)
 pygame.display.set_caption("Super Mario Land - Game Boy")
 
 # Game Boy color palette (4 colors)
@@ -25,22 +25,190 @@ GRAVITY = 0.3
 PLAYER_SPEED = 1.5
 JUMP_STRENGTH = 4.5
 SCROLL_THRESH = GB_WIDTH // 3
+GRID_CELL = 32  # Spatial hash cell size for platform lookups
+ACTOR_SIZE = 8  # Enemies and coins are 8x8
+
+# Movement keys, bound once instead of looked up on pygame every frame
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_A = pygame.K_a
+_K_D = pygame.K_d
+
+# Sprite pixel data as immutable tuples (0 = transparent unless the palette says otherwise)
+MARIO_PIXELS_R = (
+    # Frame 1 (standing/walking 1)
+    (
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,1,2,2,2,1,0,0),
+        (0,2,2,2,2,2,0,0),
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,1,0,0,0,1,0,0),
+        (0,1,0,0,0,1,0,0)
+    ),
+    # Frame 2 (walking 2)
+    (
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,1,2,2,2,1,0,0),
+        (0,2,2,2,2,2,0,0),
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,0,1,0,1,0,0,0),
+        (0,1,0,0,0,1,0,0)
+    )
+)
+MARIO_PIXELS_L = tuple(tuple(row[::-1] for row in frame) for frame in MARIO_PIXELS_R)
+
+GOOMBA_FRAME_A = (
+    (0,0,1,1,1,1,0,0),
+    (0,1,1,1,1,1,1,0),
+    (0,1,0,1,1,0,1,0),
+    (0,1,1,1,1,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,0,1,1,1,1,0,0),
+    (0,1,0,0,0,0,1,0),
+    (1,1,0,0,0,0,1,1)
+)
+# Second walking frame only differs in the feet
+GOOMBA_FRAME_B = GOOMBA_FRAME_A[:7] + ((1,0,1,0,0,1,0,1),)
+
+COIN_FULL = (
+    (0,0,1,1,1,1,0,0),
+    (0,1,1,1,1,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,1,1,1,1,0),
+    (0,0,1,1,1,1,0,0)
+)
+COIN_THIN = ((0,0,0,1,1,0,0,0),) * 8
+
+TILE_PIXELS = (
+    (1,1,1,1,1,1,1,1),
+    (1,0,0,0,0,0,0,1),
+    (1,0,1,1,1,1,0,1),
+    (1,0,1,0,0,1,0,1),
+    (1,0,1,0,0,1,0,1),
+    (1,0,1,1,1,1,0,1),
+    (1,0,0,0,0,0,0,1),
+    (1,1,1,1,1,1,1,1)
+)
+
+FLAG_PIXELS = (
+    (1,1,1,1,1,1,1,0),
+    (1,0,0,0,0,0,1,0),
+    (1,0,0,0,0,0,1,0),
+    (1,1,1,1,1,1,1,0),
+    (0,0,0,0,0,0,0,0)
+)
+
+CHAR_MAP = {
+    'A': ((1,1,1),(1,0,1),(1,1,1),(1,0,1)),
+    'B': ((1,1,0),(1,0,1),(1,1,0),(1,1,1)),
+    'C': ((1,1,1),(1,0,0),(1,0,0),(1,1,1)),
+    'D': ((1,1,0),(1,0,1),(1,0,1),(1,1,0)),
+    'E': ((1,1,1),(1,0,0),(1,1,0),(1,1,1)),
+    'F': ((1,1,1),(1,0,0),(1,1,0),(1,0,0)),
+    'G': ((1,1,1),(1,0,0),(1,0,1),(1,1,1)),
+    'H': ((1,0,1),(1,0,1),(1,1,1),(1,0,1)),
+    'I': ((1,1,1),(0,1,0),(0,1,0),(1,1,1)),
+    'J': ((0,0,1),(0,0,1),(1,0,1),(1,1,1)),
+    'K': ((1,0,1),(1,1,0),(1,1,0),(1,0,1)),
+    'L': ((1,0,0),(1,0,0),(1,0,0),(1,1,1)),
+    'M': ((1,0,1),(1,1,1),(1,0,1),(1,0,1)),
+    'N': ((1,0,1),(1,1,1),(1,1,1),(1,0,1)),
+    'O': ((1,1,1),(1,0,1),(1,0,1),(1,1,1)),
+    'P': ((1,1,1),(1,0,1),(1,1,1),(1,0,0)),
+    'Q': ((1,1,0),(1,0,1),(1,1,0),(0,0,1)),
+    'R': ((1,1,0),(1,0,1),(1,1,0),(1,0,1)),
+    'S': ((1,1,1),(1,0,0),(0,1,0),(1,1,1)),
+    'T': ((1,1,1),(0,1,0),(0,1,0),(0,1,0)),
+    'U': ((1,0,1),(1,0,1),(1,0,1),(1,1,1)),
+    'V': ((1,0,1),(1,0,1),(1,0,1),(0,1,0)),
+    'W': ((1,0,1),(1,0,1),(1,1,1),(1,0,1)),
+    'X': ((1,0,1),(0,1,0),(0,1,0),(1,0,1)),
+    'Y': ((1,0,1),(1,0,1),(0,1,0),(0,1,0)),
+    'Z': ((1,1,1),(0,0,1),(0,1,0),(1,1,1)),
+    '0': ((1,1,1),(1,0,1),(1,0,1),(1,1,1)),
+    '1': ((0,1,0),(1,1,0),(0,1,0),(1,1,1)),
+    '2': ((1,1,1),(0,0,1),(0,1,0),(1,1,1)),
+    '3': ((1,1,1),(0,0,1),(0,1,1),(1,1,1)),
+    ' ': ((0,0,0),(0,0,0),(0,0,0),(0,0,0)),
+    ':': ((0,1,0),(0,0,0),(0,1,0),(0,0,0)),
+}
+
+def _build_sprite(pixels, palette):
+    """Pre-render a pixel grid into a Surface, GB_LIGHTEST is transparent"""
+    indices = np.array(pixels, dtype=np.uint8).T  # surfarray is indexed [x, y]
+    surface = pygame.Surface(indices.shape).convert()
+    view = pygame.surfarray.pixels3d(surface)
+    view[...] = np.array(palette, dtype=np.uint8)[indices]
+    del view  # Release the surface lock
+    surface.set_colorkey(GB_LIGHTEST)
+    return surface
+
+# Pre-rendered sprites, built once so drawing is a single blit per object
+MARIO_FRAMES = {
+    1: tuple(_build_sprite(frame, (GB_LIGHTEST, GB_DARK, GB_DARKEST)) for frame in MARIO_PIXELS_R),
+    -1: tuple(_build_sprite(frame, (GB_LIGHTEST, GB_DARK, GB_DARKEST)) for frame in MARIO_PIXELS_L),
+}
+
+GOOMBA_FRAMES = (
+    _build_sprite(GOOMBA_FRAME_A, (GB_LIGHTEST, GB_DARK)),
+    _build_sprite(GOOMBA_FRAME_B, (GB_LIGHTEST, GB_DARK)),
+)
+
+# Spin cycle: full, edge-on, full, edge-on
+_COIN_FULL_SURF = _build_sprite(COIN_FULL, (GB_LIGHTEST, GB_DARKEST))
+_COIN_THIN_SURF = _build_sprite(COIN_THIN, (GB_LIGHTEST, GB_DARKEST))
+COIN_SPIN_FRAMES = (_COIN_FULL_SURF, _COIN_THIN_SURF, _COIN_FULL_SURF, _COIN_THIN_SURF)
+
+PLATFORM_TILE = _build_sprite(TILE_PIXELS, (GB_LIGHT, GB_DARK))
 
-# Font (scaled for Game Boy resolution)
-font = pygame.font.Font(None, 16)
+# Flag pole (2 = pole, columns 7-8) with the flag hanging off it at (9, 5)
+FLAG_SURF = _build_sprite(
+    tuple(tuple(2 if x in (7, 8) else 0 for x in range(9)) +
+          (FLAG_PIXELS[y - 5] if 5 <= y < 10 else (0,) * 8) for y in range(32)),
+    (GB_LIGHTEST, GB_DARK, GB_DARKEST))
+
+def _build_font(color):
+    """Render every glyph side by side into one atlas, keyed by subsurface"""
+    chars = list(CHAR_MAP)
+    atlas = _build_sprite(tuple(sum((CHAR_MAP[char][y] for char in chars), ()) for y in range(4)),
+                          (GB_LIGHTEST, color))
+    return {char: atlas.subsurface((i * 3, 0, 3, 4)) for i, char in enumerate(chars)}
+
+# Text glyphs, one atlas per palette color used for text
+GLYPHS_DARKEST = _build_font(GB_DARKEST)
+GLYPHS_DARK = _build_font(GB_DARK)
+GLYPHS_LIGHT = _build_font(GB_LIGHT)
+GLYPHS = {GB_DARKEST: GLYPHS_DARKEST, GB_DARK: GLYPHS_DARK, GB_LIGHT: GLYPHS_LIGHT}
+
+# Pixels where (x + y) is even, indexed [x, y] like surfarray views
+CHECKER_MASK = np.indices((GB_WIDTH, GB_HEIGHT)).sum(0) % 2 == 0
+
+def _make_checker(color):
+    """Pre-render a full screen stipple overlay, odd pixels are transparent"""
+    surface = pygame.Surface((GB_WIDTH, GB_HEIGHT)).convert()
+    surface.fill(GB_LIGHTEST)
+    view = pygame.surfarray.pixels3d(surface)
+    view[CHECKER_MASK] = color
+    del view  # Release the surface lock
+    surface.set_colorkey(GB_LIGHTEST)
+    return surface
+
+# Stipple overlays for the game over and victory screens
+CHECKER_DARK = _make_checker(GB_DARK)
+CHECKER_LIGHT = _make_checker(GB_LIGHT)
 
 class Sprite:
-    """Base sprite class with pixel art drawing"""
+    """Base sprite class, drawing goes through the cached sprite Surfaces"""
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.surface = pygame.Surface((GB_WIDTH, GB_HEIGHT))
-        self.surface.fill(GB_LIGHTEST)
-        
-    def draw_pixel(self, x, y, color):
-        """Draw a single pixel scaled up"""
-        pygame.draw.rect(self.surface, color, 
-                        (x, y, 1, 1))
 
 class Player(Sprite):
     def __init__(self, x, y):
@@ -55,8 +223,9 @@ class Player(Sprite):
         self.lives = 3
         self.coins = 0
         self.active = True
+        self.image = MARIO_FRAMES[1][0]
         
-    def move(self, dx, platforms, enemies, coins):
+    def move(self, dx, level):
         if not self.active:
             return
             
@@ -68,55 +237,52 @@ class Player(Sprite):
             if self.animation_frame >= 2:
                 self.animation_frame = 0
         
-        # Platform collision (horizontal)
-        for platform in platforms:
-            if self.collision(platform):
-                if dx > 0:
-                    self.x = platform.x - self.width
-                else:
-                    self.x = platform.x + platform.width
-        
-        # Gravity
-        self.vel_y += GRAVITY
-        self.y += self.vel_y
-        
-        # Platform collision (vertical)
-        on_ground = False
-        for platform in platforms:
-            if self.collision(platform):
-                if self.vel_y > 0:  # Falling
-                    self.y = platform.y - self.height
-                    self.vel_y = 0
-                    self.jumping = False
-                    on_ground = True
-                elif self.vel_y < 0:  # Jumping
-                    self.y = platform.y + platform.height
-                    self.vel_y = 0
+        # Platform collision and gravity, against the platforms near both
+        # the horizontal and the vertical move. A sideways push can move the
+        # box past the queried cells before the vertical pass, so the query
+        # is widened to cover the pushed x and the collision redone.
+        next_y = self.y + self.vel_y + GRAVITY
+        top, height = min(self.y, next_y), self.height + abs(next_y - self.y)
+        left = right = self.x
+        while True:
+            nearby = level.query(left, top, right - left + self.width, height)
+            new_x, new_y, vel_y, landed = physics.resolve_platforms(
+                self.x, self.y, self.vel_y, self.width, self.height, dx, GRAVITY,
+                level.platform_rects[nearby])
+            if left <= new_x <= right:
+                break
+            left, right = min(left, new_x), max(right, new_x)
+        self.x, self.y, self.vel_y = new_x, new_y, vel_y
+        if landed:
+            self.jumping = False
         
         # Enemy collision
-        for enemy in enemies:
-            if enemy.active and self.collision(enemy):
-                if self.vel_y > 0 and self.y < enemy.y:
-                    # Stomp enemy
-                    enemy.active = False
-                    self.vel_y = -JUMP_STRENGTH * 0.6
-                    self.coins += 1
-                elif self.invincible <= 0:
-                    # Take damage
-                    self.invincible = 60
-                    self.lives -= 1
-                    if self.lives <= 0:
-                        self.active = False
+        hits = level.check_enemy_hits(self.x, self.y, self.width, self.height)
+        for index in np.flatnonzero(hits):
+            if self.vel_y > 0 and self.y < level.enemy_xy[index, 1]:
+                # Stomp enemy
+                level.enemy_active[index] = False
+                self.vel_y = -JUMP_STRENGTH * 0.6
+                self.coins += 1
+            elif self.invincible <= 0:
+                # Take damage
+                self.invincible = 60
+                self.lives -= 1
+                if self.lives <= 0:
+                    self.active = False
         
         # Coin collection
-        for coin in coins[:]:
-            if self.collision(coin):
-                coins.remove(coin)
-                self.coins += 1
+        hits = level.check_coin_hits(self.x, self.y, self.width, self.height)
+        self.coins += int(hits.sum())
+        level.coin_alive &= ~hits
         
         # Keep player in bounds
         if self.y > GB_HEIGHT:
             self.active = False
+        
+        # Select frame
+        frame = int(self.animation_frame) if abs(self.vel_y) < 0.1 else 0
+        self.image = MARIO_FRAMES[self.direction][frame]
     
     def collision(self, obj):
         return (self.x < obj.x + obj.width and
@@ -129,62 +295,13 @@ class Player(Sprite):
             self.vel_y = -JUMP_STRENGTH
             self.jumping = True
     
-    def draw(self, surface, scroll_x):
-        if not self.active:
-            return
-            
+    def blinking(self):
+        """Advance the invincibility blink, True while Mario is hidden"""
         if self.invincible > 0:
             if self.invincible % 6 < 3:
-                return
+                return True
             self.invincible -= 1
-        
-        x_pos = int(self.x - scroll_x)
-        y_pos = int(self.y)
-        
-        # Mario sprite (8x8 pixels)
-        mario_pixels = [
-            # Frame 1 (standing/walking 1)
-            [
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,1,2,2,2,1,0,0],
-                [0,2,2,2,2,2,0,0],
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,1,0,0,0,1,0,0],
-                [0,1,0,0,0,1,0,0]
-            ],
-            # Frame 2 (walking 2)
-            [
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,1,2,2,2,1,0,0],
-                [0,2,2,2,2,2,0,0],
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,0,1,0,1,0,0,0],
-                [0,1,0,0,0,1,0,0]
-            ]
-        ]
-        
-        # Select frame
-        frame = int(self.animation_frame) if abs(self.vel_y) < 0.1 else 0
-        pixels = mario_pixels[frame]
-        
-        # Flip if facing left
-        if self.direction < 0:
-            pixels = [row[::-1] for row in pixels]
-        
-        # Draw Mario
-        for y in range(8):
-            for x in range(8):
-                if pixels[y][x] > 0:
-                    if pixels[y][x] == 1:
-                        color = GB_DARK
-                    else:
-                        color = GB_DARKEST
-                    if 0 <= x_pos + x < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                        surface.set_at((x_pos + x, y_pos + y), color)
+        return False
 
 class Platform:
     def __init__(self, x, y, width, height):
@@ -192,47 +309,49 @@ class Platform:
         self.y = y
         self.width = width
         self.height = height
-    
-    def draw(self, surface, scroll_x):
-        x_pos = int(self.x - scroll_x)
-        y_pos = int(self.y)
-        
-        # Draw platform with tile pattern
-        for ty in range(0, self.height, 8):
-            for tx in range(0, self.width, 8):
-                self.draw_tile(surface, x_pos + tx, y_pos + ty)
-    
-    def draw_tile(self, surface, x, y):
-        # 8x8 platform tile
-        tile = [
-            [1,1,1,1,1,1,1,1],
-            [1,0,0,0,0,0,0,1],
-            [1,0,1,1,1,1,0,1],
-            [1,0,1,0,0,1,0,1],
-            [1,0,1,0,0,1,0,1],
-            [1,0,1,1,1,1,0,1],
-            [1,0,0,0,0,0,0,1],
-            [1,1,1,1,1,1,1,1]
-        ]
-        
-        for ty in range(8):
-            for tx in range(8):
-                if 0 <= x + tx < GB_WIDTH and 0 <= y + ty < GB_HEIGHT:
-                    color = GB_DARK if tile[ty][tx] == 1 else GB_LIGHT
-                    surface.set_at((x + tx, y + ty), color)
+        # Offsets of the 8x8 tiles making up the platform
+        self.tiles = [(tx, ty) for ty in range(0, height, 8) for tx in range(0, width, 8)]
 
 class Enemy:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 8
-        self.height = 8
+    """View onto one enemy's row in the level's arrays"""
+    def __init__(self, level, index):
+        self.level = level
+        self.index = index
+        self.width = ACTOR_SIZE
+        self.height = ACTOR_SIZE
         self.direction = -1
         self.speed = 0.5
-        self.active = True
         self.animation_frame = 0
+        self.image = GOOMBA_FRAMES[0]
+        
+        # Platforms never move, so the walk bounds come from the platform
+        # under the spawn point once instead of a scan every frame
+        self.bounds = None
+        for index in level.query(self.x, self.y + self.height - 2, self.width, 4):
+            platform = level.platforms[index]
+            if (self.x + self.width > platform.x and 
+                self.x < platform.x + platform.width and
+                abs((self.y + self.height) - platform.y) < 2):
+                self.bounds = (platform.x, platform.x + platform.width)
+                break
+    
+    @property
+    def x(self):
+        return self.level.enemy_xy[self.index, 0]
+    
+    @x.setter
+    def x(self, value):
+        self.level.enemy_xy[self.index, 0] = value
     
-    def move(self, platforms):
+    @property
+    def y(self):
+        return self.level.enemy_xy[self.index, 1]
+    
+    @property
+    def active(self):
+        return self.level.enemy_active[self.index]
+    
+    def move(self):
         if not self.active:
             return
             
@@ -240,92 +359,16 @@ class Enemy:
         self.animation_frame += 0.1
         if self.animation_frame >= 2:
             self.animation_frame = 0
+        self.image = GOOMBA_FRAMES[int(self.animation_frame)]
         
         # Change direction at platform edges
-        on_platform = False
-        for platform in platforms:
-            if (self.x + self.width > platform.x and 
-                self.x < platform.x + platform.width and
-                abs((self.y + self.height) - platform.y) < 2):
-                on_platform = True
-                
-                if (self.direction < 0 and self.x <= platform.x) or \
-                   (self.direction > 0 and self.x + self.width >= platform.x + platform.width):
-                    self.direction *= -1
-        
-        if not on_platform:
+        if self.bounds is None:
             self.direction *= -1
-    
-    def draw(self, surface, scroll_x):
-        if not self.active:
-            return
-            
-        x_pos = int(self.x - scroll_x)
-        y_pos = int(self.y)
-        
-        # Goomba sprite (8x8)
-        goomba = [
-            [0,0,1,1,1,1,0,0],
-            [0,1,1,1,1,1,1,0],
-            [0,1,0,1,1,0,1,0],
-            [0,1,1,1,1,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,0,1,1,1,1,0,0],
-            [0,1,0,0,0,0,1,0],
-            [1,1,0,0,0,0,1,1]
-        ]
-        
-        # Animate walking
-        if int(self.animation_frame) == 1:
-            goomba[7] = [1,0,1,0,0,1,0,1]
-        
-        # Draw goomba
-        for y in range(8):
-            for x in range(8):
-                if goomba[y][x] == 1:
-                    if 0 <= x_pos + x < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                        surface.set_at((x_pos + x, y_pos + y), GB_DARK)
-
-class Coin:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 8
-        self.height = 8
-        self.animation_frame = 0
-    
-    def draw(self, surface, scroll_x):
-        x_pos = int(self.x - scroll_x)
-        y_pos = int(self.y)
-        
-        self.animation_frame += 0.1
-        
-        # Coin sprite (8x8) with animation
-        coin = [
-            [0,0,1,1,1,1,0,0],
-            [0,1,1,1,1,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,1,1,1,1,0],
-            [0,0,1,1,1,1,0,0]
-        ]
-        
-        # Animate (make it spin)
-        if int(self.animation_frame) % 4 == 1:
-            for y in range(8):
-                coin[y] = [0,0,0,1,1,0,0,0]
-        elif int(self.animation_frame) % 4 == 3:
-            for y in range(8):
-                coin[y] = [0,0,0,1,1,0,0,0]
-        
-        # Draw coin
-        for y in range(8):
-            for x in range(8):
-                if coin[y][x] == 1:
-                    if 0 <= x_pos + x < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                        surface.set_at((x_pos + x, y_pos + y), GB_DARKEST)
+        else:
+            left, right = self.bounds
+            if (self.direction < 0 and self.x <= left) or \
+               (self.direction > 0 and self.x + self.width >= right):
+                self.direction *= -1
 
 class Goal:
     def __init__(self, x, y):
@@ -333,102 +376,129 @@ class Goal:
         self.y = y
         self.width = 16
         self.height = 32
-    
-    def draw(self, surface, scroll_x):
-        x_pos = int(self.x - scroll_x)
-        y_pos = int(self.y)
-        
-        # Draw flag pole
-        for y in range(32):
-            if 0 <= x_pos + 7 < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                surface.set_at((x_pos + 7, y_pos + y), GB_DARKEST)
-                surface.set_at((x_pos + 8, y_pos + y), GB_DARKEST)
-        
-        # Draw flag
-        flag = [
-            [1,1,1,1,1,1,1,0],
-            [1,0,0,0,0,0,1,0],
-            [1,0,0,0,0,0,1,0],
-            [1,1,1,1,1,1,1,0],
-            [0,0,0,0,0,0,0,0]
-        ]
-        
-        for y in range(5):
-            for x in range(8):
-                if flag[y][x] == 1:
-                    if 0 <= x_pos + x + 9 < GB_WIDTH and 0 <= y_pos + y + 5 < GB_HEIGHT:
-                        surface.set_at((x_pos + x + 9, y_pos + y + 5), GB_DARK)
+        self.image = FLAG_SURF
 
 class Level:
     def __init__(self, level_num):
         self.level_num = level_num
         self.platforms = []
-        self.enemies = []
-        self.coins = []
+        self.platform_grid = {}  # (cell_x, cell_y) -> indices of platforms in that cell
+        self.enemy_spawns = []
+        self.coin_spawns = []
         self.goal = None
         self.level_width = 640  # 4 screens wide
         self.player_start = (20, 100)
         
         self.create_level(level_num)
+        
+        # Platform rows (x, y, width, height) for the physics kernels
+        self.platform_rects = np.array([(p.x, p.y, p.width, p.height) for p in self.platforms],
+                                       dtype=np.float64).reshape(-1, 4)
+        
+        # Enemies and coins live in structure-of-arrays form, one row each,
+        # allocated once here and updated in place every frame
+        self.enemy_xy = np.array(self.enemy_spawns, dtype=np.float64).reshape(-1, 2)
+        self.enemy_active = np.ones(len(self.enemy_xy), dtype=bool)
+        self.enemies = [Enemy(self, index) for index in range(len(self.enemy_xy))]
+        self.coin_xy = np.array(self.coin_spawns, dtype=np.float64).reshape(-1, 2)
+        self.coin_alive = np.ones(len(self.coin_xy), dtype=bool)
+        self.coin_frame = 0
+        
+        # Static scenery (platforms and goal) is rendered once, draw_game
+        # only blits the visible slice
+        self.bg = pygame.Surface((self.level_width, GB_HEIGHT)).convert()
+        self.bg.fill(GB_LIGHTEST)
+        self.bg.blits([(PLATFORM_TILE, (p.x + tx, p.y + ty)) for p in self.platforms for tx, ty in p.tiles],
+                      doreturn=0)
+        self.bg.blit(self.goal.image, (self.goal.x, self.goal.y))
     
     def create_level(self, num):
-        # Ground
-        for x in range(0, self.level_width, 16):
-            self.platforms.append(Platform(x, GB_HEIGHT - 16, 16, 16))
+        # Ground, one collider spanning the whole level
+        self.add_platform(Platform(0, GB_HEIGHT - 16, self.level_width, 16))
         
         if num == 1:
             # Level 1 - Simple
-            self.platforms.append(Platform(80, 100, 32, 8))
-            self.platforms.append(Platform(140, 80, 24, 8))
-            self.platforms.append(Platform(200, 100, 40, 8))
-            self.platforms.append(Platform(280, 90, 32, 8))
+            self.add_platform(Platform(80, 100, 32, 8))
+            self.add_platform(Platform(140, 80, 24, 8))
+            self.add_platform(Platform(200, 100, 40, 8))
+            self.add_platform(Platform(280, 90, 32, 8))
             
-            self.enemies.append(Enemy(100, 92))
-            self.enemies.append(Enemy(220, 92))
+            self.enemy_spawns.append((100, 92))
+            self.enemy_spawns.append((220, 92))
             
-            self.coins.append(Coin(90, 85))
-            self.coins.append(Coin(150, 65))
-            self.coins.append(Coin(210, 85))
+            self.coin_spawns.append((90, 85))
+            self.coin_spawns.append((150, 65))
+            self.coin_spawns.append((210, 85))
             
         elif num == 2:
             # Level 2 - More complex
-            self.platforms.append(Platform(60, 110, 24, 8))
-            self.platforms.append(Platform(100, 90, 32, 8))
-            self.platforms.append(Platform(150, 100, 24, 8))
-            self.platforms.append(Platform(190, 70, 40, 8))
-            self.platforms.append(Platform(250, 90, 32, 8))
-            self.platforms.append(Platform(300, 110, 40, 8))
+            self.add_platform(Platform(60, 110, 24, 8))
+            self.add_platform(Platform(100, 90, 32, 8))
+            self.add_platform(Platform(150, 100, 24, 8))
+            self.add_platform(Platform(190, 70, 40, 8))
+            self.add_platform(Platform(250, 90, 32, 8))
+            self.add_platform(Platform(300, 110, 40, 8))
             
-            self.enemies.append(Enemy(70, 102))
-            self.enemies.append(Enemy(160, 92))
-            self.enemies.append(Enemy(200, 62))
-            self.enemies.append(Enemy(310, 102))
+            self.enemy_spawns.append((70, 102))
+            self.enemy_spawns.append((160, 92))
+            self.enemy_spawns.append((200, 62))
+            self.enemy_spawns.append((310, 102))
             
             for i in range(6):
-                self.coins.append(Coin(70 + i * 40, 50 + (i % 2) * 20))
+                self.coin_spawns.append((70 + i * 40, 50 + (i % 2) * 20))
                 
         elif num == 3:
             # Level 3 - Challenging
-            self.platforms.append(Platform(50, 100, 24, 8))
-            self.platforms.append(Platform(90, 80, 24, 8))
-            self.platforms.append(Platform(130, 110, 32, 8))
-            self.platforms.append(Platform(180, 70, 24, 8))
-            self.platforms.append(Platform(220, 90, 40, 8))
-            self.platforms.append(Platform(280, 60, 32, 8))
-            self.platforms.append(Platform(340, 100, 48, 8))
+            self.add_platform(Platform(50, 100, 24, 8))
+            self.add_platform(Platform(90, 80, 24, 8))
+            self.add_platform(Platform(130, 110, 32, 8))
+            self.add_platform(Platform(180, 70, 24, 8))
+            self.add_platform(Platform(220, 90, 40, 8))
+            self.add_platform(Platform(280, 60, 32, 8))
+            self.add_platform(Platform(340, 100, 48, 8))
             
-            self.enemies.append(Enemy(60, 92))
-            self.enemies.append(Enemy(140, 102))
-            self.enemies.append(Enemy(190, 62))
-            self.enemies.append(Enemy(230, 82))
-            self.enemies.append(Enemy(290, 52))
-            self.enemies.append(Enemy(350, 92))
+            self.enemy_spawns.append((60, 92))
+            self.enemy_spawns.append((140, 102))
+            self.enemy_spawns.append((190, 62))
+            self.enemy_spawns.append((230, 82))
+            self.enemy_spawns.append((290, 52))
+            self.enemy_spawns.append((350, 92))
             
             for i in range(8):
-                self.coins.append(Coin(60 + i * 35, 40 + (i % 3) * 15))
+                self.coin_spawns.append((60 + i * 35, 40 + (i % 3) * 15))
         
         # Goal at end of level
         self.goal = Goal(self.level_width - 40, GB_HEIGHT - 48)
+    
+    def add_platform(self, platform):
+        """Add a platform and register it in every grid cell it covers"""
+        index = len(self.platforms)
+        self.platforms.append(platform)
+        for cx in range(platform.x // GRID_CELL, (platform.x + platform.width - 1) // GRID_CELL + 1):
+            for cy in range(platform.y // GRID_CELL, (platform.y + platform.height - 1) // GRID_CELL + 1):
+                self.platform_grid.setdefault((cx, cy), []).append(index)
+    
+    def query(self, x, y, width, height):
+        """Indices of platforms sharing a grid cell with a rectangle, in level order"""
+        found = set()
+        for cx in range(int(x // GRID_CELL), int((x + width) // GRID_CELL) + 1):
+            for cy in range(int(y // GRID_CELL), int((y + height) // GRID_CELL) + 1):
+                found.update(self.platform_grid.get((cx, cy), ()))
+        return sorted(found)
+    
+    def active_enemies(self):
+        """Enemies that have not been stomped"""
+        return [self.enemies[index] for index in np.flatnonzero(self.enemy_active)]
+    
+    def check_enemy_hits(self, x, y, width, height):
+        """Mask of active enemies overlapping a rectangle"""
+        return self.enemy_active & physics.aabb_mask(
+            x, y, width, height, self.enemy_xy[:, 0], self.enemy_xy[:, 1], ACTOR_SIZE, ACTOR_SIZE)
+    
+    def check_coin_hits(self, x, y, width, height):
+        """Mask of remaining coins overlapping a rectangle"""
+        return self.coin_alive & physics.aabb_mask(
+            x, y, width, height, self.coin_xy[:, 0], self.coin_xy[:, 1], ACTOR_SIZE, ACTOR_SIZE)
 
 class Game:
     def __init__(self):
@@ -437,8 +507,13 @@ class Game:
         self.player = None
         self.level = None
         self.scroll_x = 0
-        self.gb_surface = pygame.Surface((GB_WIDTH, GB_HEIGHT))
+        self.gb_surface = pygame.Surface((GB_WIDTH, GB_HEIGHT)).convert()
         self.level_unlocked = [True, False, False]
+        # Screen currently in gb_surface, the static menus are only drawn when entered
+        self.drawn_state = None
+        # Keyboard only game, SDL drops every other event before it is queued
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         
     def start_level(self, level_num):
         self.current_level = level_num
@@ -450,61 +525,23 @@ class Game:
     def draw_text(self, surface, text, x, y, color=GB_DARKEST):
         """Draw pixelated text"""
         char_width = 4
-        char_map = {
-            'A': [[1,1,1],[1,0,1],[1,1,1],[1,0,1]],
-            'B': [[1,1,0],[1,0,1],[1,1,0],[1,1,1]],
-            'C': [[1,1,1],[1,0,0],[1,0,0],[1,1,1]],
-            'D': [[1,1,0],[1,0,1],[1,0,1],[1,1,0]],
-            'E': [[1,1,1],[1,0,0],[1,1,0],[1,1,1]],
-            'F': [[1,1,1],[1,0,0],[1,1,0],[1,0,0]],
-            'G': [[1,1,1],[1,0,0],[1,0,1],[1,1,1]],
-            'H': [[1,0,1],[1,0,1],[1,1,1],[1,0,1]],
-            'I': [[1,1,1],[0,1,0],[0,1,0],[1,1,1]],
-            'J': [[0,0,1],[0,0,1],[1,0,1],[1,1,1]],
-            'K': [[1,0,1],[1,1,0],[1,1,0],[1,0,1]],
-            'L': [[1,0,0],[1,0,0],[1,0,0],[1,1,1]],
-            'M': [[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
-            'N': [[1,0,1],[1,1,1],[1,1,1],[1,0,1]],
-            'O': [[1,1,1],[1,0,1],[1,0,1],[1,1,1]],
-            'P': [[1,1,1],[1,0,1],[1,1,1],[1,0,0]],
-            'Q': [[1,1,0],[1,0,1],[1,1,0],[0,0,1]],
-            'R': [[1,1,0],[1,0,1],[1,1,0],[1,0,1]],
-            'S': [[1,1,1],[1,0,0],[0,1,0],[1,1,1]],
-            'T': [[1,1,1],[0,1,0],[0,1,0],[0,1,0]],
-            'U': [[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
-            'V': [[1,0,1],[1,0,1],[1,0,1],[0,1,0]],
-            'W': [[1,0,1],[1,0,1],[1,1,1],[1,0,1]],
-            'X': [[1,0,1],[0,1,0],[0,1,0],[1,0,1]],
-            'Y': [[1,0,1],[1,0,1],[0,1,0],[0,1,0]],
-            'Z': [[1,1,1],[0,0,1],[0,1,0],[1,1,1]],
-            '0': [[1,1,1],[1,0,1],[1,0,1],[1,1,1]],
-            '1': [[0,1,0],[1,1,0],[0,1,0],[1,1,1]],
-            '2': [[1,1,1],[0,0,1],[0,1,0],[1,1,1]],
-            '3': [[1,1,1],[0,0,1],[0,1,1],[1,1,1]],
-            ' ': [[0,0,0],[0,0,0],[0,0,0],[0,0,0]],
-            ':': [[0,1,0],[0,0,0],[0,1,0],[0,0,0]],
-        }
-        
-        for i, char in enumerate(text.upper()):
-            if char in char_map:
-                pixels = char_map[char]
-                for cy in range(4):
-                    for cx in range(3):
-                        if pixels[cy][cx] == 1:
-                            if 0 <= x + i*char_width + cx < GB_WIDTH and 0 <= y + cy < GB_HEIGHT:
-                                surface.set_at((x + i*char_width + cx, y + cy), color)
+        glyphs = GLYPHS[color]
+        surface.blits([(glyphs[char], (x + i*char_width, y))
+                       for i, char in enumerate(text.upper()) if char in glyphs], doreturn=0)
     
     def run(self):
         clock = pygame.time.Clock()
+        key_left, key_right, key_a, key_d = _K_LEFT, _K_RIGHT, _K_A, _K_D
+        QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
         
         while True:
             # Handle events
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event.type == QUIT:
                     pygame.quit()
                     sys.exit()
                 
-                if event.type == pygame.KEYDOWN:
+                if event.type == KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         if self.state == "playing":
                             self.state = "menu"
@@ -529,23 +566,20 @@ class Game:
                         if event.key == pygame.K_RETURN:
                             self.state = "level_select"
             
-            # Clear Game Boy surface
-            self.gb_surface.fill(GB_LIGHTEST)
-            
             # Game logic and drawing
             if self.state == "playing":
                 keys = pygame.key.get_pressed()
                 dx = 0
-                if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+                if keys[key_left] or keys[key_a]:
                     dx = -PLAYER_SPEED
-                if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+                if keys[key_right] or keys[key_d]:
                     dx = PLAYER_SPEED
                 
-                self.player.move(dx, self.level.platforms, self.level.enemies, self.level.coins)
+                self.player.move(dx, self.level)
                 
-                # Move enemies
-                for enemy in self.level.enemies:
-                    enemy.move(self.level.platforms)
+                # Move enemies, stomped ones stay in the arrays but are skipped
+                for enemy in self.level.active_enemies():
+                    enemy.move()
                 
                 # Camera scrolling
                 if self.player.x - self.scroll_x > GB_WIDTH - SCROLL_THRESH:
@@ -569,22 +603,26 @@ class Game:
                 # Draw game
                 self.draw_game()
                 
-            elif self.state == "menu":
-                self.draw_menu()
-            elif self.state == "level_select":
-                self.draw_level_select()
+            elif self.state in ("menu", "level_select"):
+                # Static screens are only drawn when entered
+                if self.drawn_state != self.state:
+                    self.gb_surface.fill(GB_LIGHTEST)
+                    if self.state == "menu":
+                        self.draw_menu()
+                    else:
+                        self.draw_level_select()
             elif self.state == "game_over":
                 self.draw_game()
                 self.draw_game_over()
             elif self.state == "victory":
                 self.draw_game()
                 self.draw_victory()
+            self.drawn_state = self.state
             
-            # Scale up and display
-            scaled_surface = pygame.transform.scale(self.gb_surface, (WIDTH, HEIGHT))
-            screen.blit(scaled_surface, (0, 0))
-            
-            pygame.display.flip()
+            # The SCALED renderer presents the whole window every update, so
+            # the frame is copied and presented in full
+            screen.blit(self.gb_surface, (0, 0))
+            pygame.display.update()
             clock.tick(FPS)
     
     def draw_menu(self):
@@ -596,22 +634,7 @@ class Game:
         self.draw_text(self.gb_surface, "PRESS ENTER", 40, 80)
         
         # Draw Mario
-        mario = [
-            [0,0,1,1,1,0,0,0],
-            [0,1,1,1,1,1,0,0],
-            [0,1,2,2,2,1,0,0],
-            [0,2,2,2,2,2,0,0],
-            [0,0,1,1,1,0,0,0],
-            [0,1,1,1,1,1,0,0],
-            [0,1,0,0,0,1,0,0],
-            [0,1,0,0,0,1,0,0]
-        ]
-        
-        for y in range(8):
-            for x in range(8):
-                if mario[y][x] > 0:
-                    color = GB_DARK if mario[y][x] == 1 else GB_DARKEST
-                    self.gb_surface.set_at((76 + x, 100 + y), color)
+        self.gb_surface.blit(MARIO_FRAMES[1][0], (76, 100))
     
     def draw_level_select(self):
         self.draw_text(self.gb_surface, "SELECT LEVEL", 35, 20)
@@ -624,25 +647,46 @@ class Game:
             else:
                 self.draw_text(self.gb_surface, "LOCKED", 50, y_pos, GB_LIGHT)
     
+    def visible_mask(self, xy, alive):
+        """Mask of the live 8x8 actors overlapping the visible part of the level"""
+        xs = xy[:, 0]
+        return alive & (xs + ACTOR_SIZE >= self.scroll_x) & (xs <= self.scroll_x + GB_WIDTH)
+    
+    def screen_positions(self, xy, visible):
+        """Integer screen positions of the masked actors, computed in one pass"""
+        positions = xy[visible]
+        positions[:, 0] -= self.scroll_x
+        return list(map(tuple, positions.astype(int).tolist()))
+    
     def draw_game(self):
-        # Draw platforms
-        for platform in self.level.platforms:
-            platform.draw(self.gb_surface, self.scroll_x)
+        """Draw the level and HUD"""
+        scroll_x = self.scroll_x
+        level = self.level
+        
+        # Scenery, ceil matches the int(x - scroll_x) placement of the sprites
+        self.gb_surface.blit(level.bg, (0, 0), (math.ceil(scroll_x), 0, GB_WIDTH, GB_HEIGHT))
+        
+        # Collect every visible sprite and draw them with a single blits call
+        blit_seq = []
         
-        # Draw coins
-        for coin in self.level.coins:
-            coin.draw(self.gb_surface, self.scroll_x)
+        # Coins (all spin in step)
+        level.coin_frame += 0.1
+        coin_image = COIN_SPIN_FRAMES[int(level.coin_frame) & 3]
+        visible = self.visible_mask(level.coin_xy, level.coin_alive)
+        blit_seq.extend((coin_image, pos) for pos in self.screen_positions(level.coin_xy, visible))
         
-        # Draw enemies
-        for enemy in self.level.enemies:
-            enemy.draw(self.gb_surface, self.scroll_x)
+        # Enemies
+        visible = self.visible_mask(level.enemy_xy, level.enemy_active)
+        enemies = level.enemies
+        blit_seq.extend((enemies[index].image, pos) for index, pos in
+                        zip(np.flatnonzero(visible), self.screen_positions(level.enemy_xy, visible)))
         
-        # Draw goal
-        if self.level.goal:
-            self.level.goal.draw(self.gb_surface, self.scroll_x)
+        # Player
+        player = self.player
+        if player.active and not player.blinking():
+            blit_seq.append((player.image, (int(player.x - scroll_x), int(player.y))))
         
-        # Draw player
-        self.player.draw(self.gb_surface, self.scroll_x)
+        self.gb_surface.blits(blit_seq, doreturn=0)
         
         # Draw UI
         self.draw_text(self.gb_surface, f"L:{self.player.lives}", 5, 5)
@@ -651,20 +695,14 @@ class Game:
     
     def draw_game_over(self):
         # Darken screen
-        for y in range(GB_HEIGHT):
-            for x in range(GB_WIDTH):
-                if (x + y) % 2 == 0:
-                    self.gb_surface.set_at((x, y), GB_DARK)
+        self.gb_surface.blit(CHECKER_DARK, (0, 0))
         
         self.draw_text(self.gb_surface, "GAME OVER", 50, 60)
         self.draw_text(self.gb_surface, "PRESS ENTER", 45, 80)
     
     def draw_victory(self):
         # Darken screen
-        for y in range(GB_HEIGHT):
-            for x in range(GB_WIDTH):
-                if (x + y) % 2 == 0:
-                    self.gb_surface.set_at((x, y), GB_LIGHT)
+        self.gb_surface.blit(CHECKER_LIGHT, (0, 0))
         
         self.draw_text(self.gb_surface, "LEVEL CLEAR", 45, 60)
         self.draw_text(self.gb_surface, f"COINS: {self.player.coins}", 50, 75)
@@ -1,9 +1,12 @@
 import pygame
 import sys
 import math
+import functools
 import random
 import numpy as np
 
+import physics
+
 # Initialize pygame and mixer for audio
 pygame.init()
 pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
@@ -21,6 +24,11 @@ GB_DARK = (48, 98, 48)         # Dark green
 GB_LIGHT = (139, 172, 15)      # Light green
 GB_LIGHTEST = (155, 188, 15)   # Lightest green
 
+# Colors filled every frame, pre-mapped to the display's pixel format that
+# every converted Surface shares, so the fills skip the RGB mapping
+GB_DARKEST_PIXEL = screen.map_rgb(GB_DARKEST)
+GB_LIGHT_PIXEL = screen.map_rgb(GB_LIGHT)
+
 # Game constants
 FPS = 60
 GRAVITY = 0.3
@@ -29,59 +37,62 @@ JUMP_STRENGTH = 4.5
 SCROLL_THRESH = GB_WIDTH // 3
 
 # Sound generation functions
+@functools.lru_cache(maxsize=64)
 def generate_square_wave(frequency, duration, sample_rate=22050, volume=0.3):
-    """Generate a square wave (classic 8-bit sound)"""
+    """Generate a square wave (classic 8-bit sound) as 16-bit samples"""
     frames = int(duration * sample_rate)
-    arr = np.zeros(frames)
     samples_per_cycle = sample_rate / frequency
+    amplitude = int(volume * 32767)
     
-    for i in range(frames):
-        if (i % samples_per_cycle) < (samples_per_cycle / 2):
-            arr[i] = volume
-        else:
-            arr[i] = -volume
+    # High for the first half of every cycle, low for the second
+    t = np.arange(frames)
+    arr = np.where((t % samples_per_cycle) < (samples_per_cycle / 2), amplitude, -amplitude).astype(np.int16)
     
-    # Fade out to prevent clicks
+    # Fade out to prevent clicks, the last sample ends at zero
     fade_frames = int(0.01 * sample_rate)
-    for i in range(fade_frames):
-        arr[-(i+1)] *= i / fade_frames
+    arr[-fade_frames:] = arr[-fade_frames:] * (np.arange(fade_frames - 1, -1, -1) / fade_frames)
     
+    # Cached and shared between effects, so it must not be modified
+    arr.setflags(write=False)
     return arr
 
+def generate_melody(*notes):
+    """Join (frequency, duration) square wave notes into one wave"""
+    return np.concatenate([generate_square_wave(frequency, duration) for frequency, duration in notes])
+
+@functools.lru_cache(maxsize=16)
+def noise_envelope(frames):
+    """Exponential decay curve for noise bursts, shared by every burst of the same length"""
+    envelope = np.exp(-np.linspace(0, 5, frames))
+    envelope.setflags(write=False)
+    return envelope
+
 def generate_noise(duration, sample_rate=22050, volume=0.2):
-    """Generate white noise for explosion effects"""
+    """Generate white noise for explosion effects as 16-bit samples"""
     frames = int(duration * sample_rate)
-    noise = np.random.normal(0, volume, frames)
+    noise = np.random.normal(0, volume * 32767, frames)
     
     # Envelope
-    envelope = np.exp(-np.linspace(0, 5, frames))
-    return noise * envelope
+    noise *= noise_envelope(frames)
+    return noise.astype(np.int16)
 
 def create_sound(wave_data, sample_rate=22050):
-    """Convert wave data to pygame sound"""
-    wave_data = np.array(wave_data * 32767, dtype=np.int16)
-    stereo_data = np.zeros((len(wave_data), 2), dtype=np.int16)
-    stereo_data[:, 0] = wave_data
-    stereo_data[:, 1] = wave_data
-    sound = pygame.sndarray.make_sound(stereo_data)
+    """Convert 16-bit wave data to pygame sound"""
+    # Same samples on both channels, interleaved into one contiguous buffer
+    stereo_data = np.column_stack((wave_data, wave_data))
+    # Already int16 stereo in the mixer's format, so hand over the raw buffer
+    sound = pygame.mixer.Sound(buffer=stereo_data)
     return sound
 
 # Create Game Boy style sound effects
 class SoundEffects:
     def __init__(self):
         # Jump sound - rising pitch
-        jump_wave = np.concatenate([
-            generate_square_wave(200, 0.05),
-            generate_square_wave(400, 0.05),
-            generate_square_wave(600, 0.05)
-        ])
+        jump_wave = generate_melody((200, 0.05), (400, 0.05), (600, 0.05))
         self.jump = create_sound(jump_wave)
         
         # Coin sound - two quick high notes
-        coin_wave = np.concatenate([
-            generate_square_wave(800, 0.1),
-            generate_square_wave(1000, 0.1)
-        ])
+        coin_wave = generate_melody((800, 0.1), (1000, 0.1))
         self.coin = create_sound(coin_wave)
         
         # Stomp sound - quick low note
@@ -89,29 +100,20 @@ class SoundEffects:
         self.stomp = create_sound(stomp_wave)
         
         # Damage sound - descending notes
-        damage_wave = np.concatenate([
-            generate_square_wave(400, 0.1),
-            generate_square_wave(300, 0.1),
-            generate_square_wave(200, 0.1)
-        ])
+        damage_wave = generate_melody((400, 0.1), (300, 0.1), (200, 0.1))
         self.damage = create_sound(damage_wave)
         
         # Victory fanfare
-        victory_wave = np.concatenate([
-            generate_square_wave(523, 0.15),  # C
-            generate_square_wave(659, 0.15),  # E
-            generate_square_wave(784, 0.15),  # G
-            generate_square_wave(1047, 0.3)   # High C
-        ])
+        victory_wave = generate_melody(
+            (523, 0.15),  # C
+            (659, 0.15),  # E
+            (784, 0.15),  # G
+            (1047, 0.3)   # High C
+        )
         self.victory = create_sound(victory_wave)
         
         # Game over sound
-        gameover_wave = np.concatenate([
-            generate_square_wave(300, 0.2),
-            generate_square_wave(250, 0.2),
-            generate_square_wave(200, 0.2),
-            generate_square_wave(150, 0.4)
-        ])
+        gameover_wave = generate_melody((300, 0.2), (250, 0.2), (200, 0.2), (150, 0.4))
         self.gameover = create_sound(gameover_wave)
         
         # Menu select
@@ -121,18 +123,261 @@ class SoundEffects:
 # Initialize sound effects
 sounds = SoundEffects()
 
+# Sprite pixel data as immutable tuples (0 = transparent unless the palette says otherwise)
+MARIO_PIXELS = (
+    # Frame 1 (standing/walking 1)
+    (
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,1,2,2,2,1,0,0),
+        (0,2,2,2,2,2,0,0),
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,1,0,0,0,1,0,0),
+        (0,1,0,0,0,1,0,0)
+    ),
+    # Frame 2 (walking 2)
+    (
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,1,2,2,2,1,0,0),
+        (0,2,2,2,2,2,0,0),
+        (0,0,1,1,1,0,0,0),
+        (0,1,1,1,1,1,0,0),
+        (0,0,1,0,1,0,0,0),
+        (0,1,0,0,0,1,0,0)
+    )
+)
+
+# Upside down Mario sprite
+MARIO_DEATH_PIXELS = (
+    (0,1,0,0,0,1,0,0),
+    (0,1,0,0,0,1,0,0),
+    (0,1,1,1,1,1,0,0),
+    (0,0,1,1,1,0,0,0),
+    (0,2,2,2,2,2,0,0),
+    (0,1,2,2,2,1,0,0),
+    (0,1,1,1,1,1,0,0),
+    (0,0,1,1,1,0,0,0)
+)
+
+# Goomba (walking feet in the second frame)
+GOOMBA_PIXELS = (
+    (
+        (0,0,1,1,1,1,0,0),
+        (0,1,1,1,1,1,1,0),
+        (0,1,0,1,1,0,1,0),
+        (0,1,1,1,1,1,1,0),
+        (0,1,1,0,0,1,1,0),
+        (0,0,1,1,1,1,0,0),
+        (0,1,0,0,0,0,1,0),
+        (1,1,0,0,0,0,1,1)
+    ),
+    (
+        (0,0,1,1,1,1,0,0),
+        (0,1,1,1,1,1,1,0),
+        (0,1,0,1,1,0,1,0),
+        (0,1,1,1,1,1,1,0),
+        (0,1,1,0,0,1,1,0),
+        (0,0,1,1,1,1,0,0),
+        (0,1,0,0,0,0,1,0),
+        (1,0,1,0,0,1,0,1)
+    )
+)
+
+# Flying enemy (wings flapped in the second frame)
+FLYING_PIXELS = (
+    (
+        (0,1,0,0,0,0,1,0),
+        (0,0,1,0,0,1,0,0),
+        (1,1,1,1,1,1,1,1),
+        (1,0,1,1,1,1,0,1),
+        (1,1,1,0,0,1,1,1),
+        (0,1,1,1,1,1,1,0),
+        (0,0,1,0,0,1,0,0),
+        (0,0,0,1,1,0,0,0)
+    ),
+    (
+        (0,1,0,0,0,0,1,0),
+        (0,0,1,0,0,1,0,0),
+        (1,0,1,1,1,1,0,1),
+        (1,0,1,1,1,1,0,1),
+        (1,1,1,0,0,1,1,1),
+        (0,1,1,1,1,1,1,0),
+        (0,0,1,0,0,1,0,0),
+        (0,0,0,1,1,0,0,0)
+    )
+)
+
+COIN_PIXELS = (
+    (0,0,1,1,1,1,0,0),
+    (0,1,1,1,1,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,0,0,1,1,0),
+    (0,1,1,1,1,1,1,0),
+    (0,0,1,1,1,1,0,0)
+)
+
+# Coin seen edge-on while spinning
+COIN_THIN_PIXELS = ((0,0,0,1,1,0,0,0),) * 8
+
+# 8x8 platform tile
+TILE_PIXELS = (
+    (1,1,1,1,1,1,1,1),
+    (1,0,0,0,0,0,0,1),
+    (1,0,1,1,1,1,0,1),
+    (1,0,1,0,0,1,0,1),
+    (1,0,1,0,0,1,0,1),
+    (1,0,1,1,1,1,0,1),
+    (1,0,0,0,0,0,0,1),
+    (1,1,1,1,1,1,1,1)
+)
+
+FLAG_PIXELS = (
+    (1,1,1,1,1,1,1,0),
+    (1,0,0,0,0,0,1,0),
+    (1,0,0,0,0,0,1,0),
+    (1,1,1,1,1,1,1,0),
+    (0,0,0,0,0,0,0,0)
+)
+
+def _build_sprite(pixels, palette):
+    """Render a pixel grid through a palette into a colorkeyed Surface"""
+    indices = np.array(pixels, dtype=np.uint8).T  # surfarray is indexed [x, y]
+    surface = pygame.Surface(indices.shape).convert()
+    pygame.surfarray.blit_array(surface, np.array(palette, dtype=np.uint8)[indices])
+    surface.set_colorkey(GB_LIGHTEST)
+    return surface
+
+def _build_mario(palette):
+    """Walk frames keyed by facing direction, the left frames are mirrored copies"""
+    frames_right = tuple(_build_sprite(frame, palette) for frame in MARIO_PIXELS)
+    frames_left = tuple(pygame.transform.flip(frame, True, False) for frame in frames_right)
+    return {1: frames_right, -1: frames_left}
+
+# Pre-rendered sprites, built once so drawing is a single blit per object.
+# Mario is indexed [power_up][direction][frame], power-up darkens his body.
+MARIO_FRAMES = {
+    False: _build_mario((GB_LIGHTEST, GB_DARK, GB_DARKEST)),
+    True: _build_mario((GB_LIGHTEST, GB_DARKEST, GB_DARKEST)),
+}
+MARIO_DEATH_SURF = _build_sprite(MARIO_DEATH_PIXELS, (GB_LIGHTEST, GB_DARK, GB_DARKEST))
+
+# Enemy frames indexed [enemy_type][frame]
+ENEMY_FRAMES = (
+    tuple(_build_sprite(frame, (GB_LIGHTEST, GB_DARK)) for frame in GOOMBA_PIXELS),
+    tuple(_build_sprite(frame, (GB_LIGHTEST, GB_DARK)) for frame in FLYING_PIXELS),
+)
+
+# Spin cycle: full, edge-on, full, edge-on
+_COIN_FULL_SURF = _build_sprite(COIN_PIXELS, (GB_LIGHTEST, GB_DARKEST))
+_COIN_THIN_SURF = _build_sprite(COIN_THIN_PIXELS, (GB_LIGHTEST, GB_DARKEST))
+COIN_SPIN_FRAMES = (_COIN_FULL_SURF, _COIN_THIN_SURF, _COIN_FULL_SURF, _COIN_THIN_SURF)
+
+PLATFORM_TILE = _build_sprite(TILE_PIXELS, (GB_LIGHT, GB_DARK))
+
+# One Surface per flag row, each row is shifted separately as the flag waves
+FLAG_ROWS = tuple(_build_sprite((row,), (GB_LIGHTEST, GB_DARK)) for row in FLAG_PIXELS)
+
+# 3x4 pixel font
+CHAR_MAP = {
+    'A': ((1,1,1),(1,0,1),(1,1,1),(1,0,1)),
+    'B': ((1,1,0),(1,0,1),(1,1,0),(1,1,1)),
+    'C': ((1,1,1),(1,0,0),(1,0,0),(1,1,1)),
+    'D': ((1,1,0),(1,0,1),(1,0,1),(1,1,0)),
+    'E': ((1,1,1),(1,0,0),(1,1,0),(1,1,1)),
+    'F': ((1,1,1),(1,0,0),(1,1,0),(1,0,0)),
+    'G': ((1,1,1),(1,0,0),(1,0,1),(1,1,1)),
+    'H': ((1,0,1),(1,0,1),(1,1,1),(1,0,1)),
+    'I': ((1,1,1),(0,1,0),(0,1,0),(1,1,1)),
+    'J': ((0,0,1),(0,0,1),(1,0,1),(1,1,1)),
+    'K': ((1,0,1),(1,1,0),(1,1,0),(1,0,1)),
+    'L': ((1,0,0),(1,0,0),(1,0,0),(1,1,1)),
+    'M': ((1,0,1),(1,1,1),(1,0,1),(1,0,1)),
+    'N': ((1,0,1),(1,1,1),(1,1,1),(1,0,1)),
+    'O': ((1,1,1),(1,0,1),(1,0,1),(1,1,1)),
+    'P': ((1,1,1),(1,0,1),(1,1,1),(1,0,0)),
+    'Q': ((1,1,0),(1,0,1),(1,1,0),(0,0,1)),
+    'R': ((1,1,0),(1,0,1),(1,1,0),(1,0,1)),
+    'S': ((1,1,1),(1,0,0),(0,1,0),(1,1,1)),
+    'T': ((1,1,1),(0,1,0),(0,1,0),(0,1,0)),
+    'U': ((1,0,1),(1,0,1),(1,0,1),(1,1,1)),
+    'V': ((1,0,1),(1,0,1),(1,0,1),(0,1,0)),
+    'W': ((1,0,1),(1,0,1),(1,1,1),(1,0,1)),
+    'X': ((1,0,1),(0,1,0),(0,1,0),(1,0,1)),
+    'Y': ((1,0,1),(1,0,1),(0,1,0),(0,1,0)),
+    'Z': ((1,1,1),(0,0,1),(0,1,0),(1,1,1)),
+    '0': ((1,1,1),(1,0,1),(1,0,1),(1,1,1)),
+    '1': ((0,1,0),(1,1,0),(0,1,0),(1,1,1)),
+    '2': ((1,1,1),(0,0,1),(0,1,0),(1,1,1)),
+    '3': ((1,1,1),(0,0,1),(0,1,1),(1,1,1)),
+    '4': ((1,0,1),(1,0,1),(1,1,1),(0,0,1)),
+    '5': ((1,1,1),(1,0,0),(0,1,1),(1,1,0)),
+    '6': ((1,1,1),(1,0,0),(1,1,1),(1,1,1)),
+    ' ': ((0,0,0),(0,0,0),(0,0,0),(0,0,0)),
+    ':': ((0,1,0),(0,0,0),(0,1,0),(0,0,0)),
+    '!': ((0,1,0),(0,1,0),(0,0,0),(0,1,0)),
+}
+
+def _build_font(color):
+    """Render every glyph side by side into one atlas, keyed by subsurface"""
+    chars = list(CHAR_MAP)
+    atlas = _build_sprite(tuple(sum((CHAR_MAP[char][y] for char in chars), ()) for y in range(4)),
+                          (GB_LIGHTEST, color))
+    return {char: atlas.subsurface((i * 3, 0, 3, 4)) for i, char in enumerate(chars)}
+
+# Text glyphs, one atlas per palette color used for text
+GLYPHS = {color: _build_font(color) for color in (GB_DARKEST, GB_DARK, GB_LIGHT)}
+
+@functools.lru_cache(maxsize=256)
+def render_text(text, color):
+    """Lay a string out once into a colorkeyed Surface, 4 pixels per character"""
+    char_width = 4
+    glyphs = GLYPHS[color]
+    surface = pygame.Surface((len(text) * char_width, 4)).convert()
+    surface.fill(GB_LIGHTEST)
+    surface.blits([(glyphs[char], (i*char_width, 0))
+                   for i, char in enumerate(text.upper()) if char in glyphs], doreturn=0)
+    surface.set_colorkey(GB_LIGHTEST)
+    return surface
+
+# Highlighted level select labels, indexed by level number - 1
+LEVEL_HIGHLIGHTS = tuple(render_text(f"LEVEL {num}", GB_DARKEST) for num in range(1, 6))
+
+# x + y for every pixel, indexed [x, y] like surfarray views
+PIXEL_XY_SUM = np.add.outer(np.arange(GB_WIDTH, dtype=np.int16), np.arange(GB_HEIGHT, dtype=np.int16))
+CHECKER_MASK = PIXEL_XY_SUM % 2 == 0
+
+def _build_overlay(mask, color):
+    """Pre-render a full screen pattern, pixels outside the mask are transparent"""
+    surface = pygame.Surface((GB_WIDTH, GB_HEIGHT)).convert()
+    surface.fill(GB_LIGHTEST)
+    view = pygame.surfarray.pixels3d(surface)
+    view[mask] = color
+    del view  # Release the surface lock
+    surface.set_colorkey(GB_LIGHTEST)
+    return surface
+
+# Game over stipple, and the victory stripes at each of their three phases
+GAME_OVER_OVERLAY = _build_overlay(CHECKER_MASK, GB_DARK)
+VICTORY_OVERLAYS = tuple(_build_overlay((PIXEL_XY_SUM + phase) % 3 == 0, GB_LIGHT) for phase in range(3))
+
+# pygame-ce's fblits skips building the list of dirty rects, plain pygame
+# only has blits, where doreturn=0 does the same
+if hasattr(pygame.Surface, "fblits"):
+    def _blit_batch(surface, blit_seq):
+        surface.fblits(blit_seq)
+else:
+    def _blit_batch(surface, blit_seq):
+        surface.blits(blit_seq, doreturn=0)
+
 class Sprite:
-    """Base sprite class with pixel art drawing"""
+    """Base sprite class, drawing goes through the cached sprite Surfaces"""
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.surface = pygame.Surface((GB_WIDTH, GB_HEIGHT))
-        self.surface.fill(GB_LIGHTEST)
-        
-    def draw_pixel(self, x, y, color):
-        """Draw a single pixel scaled up"""
-        pygame.draw.rect(self.surface, color, 
-                        (x, y, 1, 1))
 
 class Player(Sprite):
     def __init__(self, x, y):
@@ -142,7 +387,7 @@ class Player(Sprite):
         self.vel_y = 0
         self.jumping = False
         self.direction = 1
-        self.animation_frame = 0
+        self.anim_tick = 0  # Frames spent walking
         self.invincible = 0
         self.lives = 3
         self.coins = 0
@@ -151,7 +396,7 @@ class Player(Sprite):
         self.dying = False
         self.death_timer = 0
         
-    def move(self, dx, platforms, enemies, coins):
+    def move(self, dx, level):
         if not self.active:
             return
         
@@ -161,9 +406,6 @@ class Player(Sprite):
             self.vel_y += GRAVITY * 0.5  # Slower fall when dying
             self.y += self.vel_y
             
-            # Spin effect
-            self.animation_frame += 0.5
-            
             # After death animation, set inactive
             if self.death_timer > 60 or self.y > GB_HEIGHT + 20:
                 self.active = False
@@ -174,37 +416,17 @@ class Player(Sprite):
         self.x += dx * speed_mult
         if dx != 0:
             self.direction = 1 if dx > 0 else -1
-            self.animation_frame += 0.2
-            if self.animation_frame >= 2:
-                self.animation_frame = 0
-        
-        # Platform collision (horizontal)
-        for platform in platforms:
-            if self.collision(platform):
-                if dx > 0:
-                    self.x = platform.x - self.width
-                else:
-                    self.x = platform.x + platform.width
-        
-        # Gravity
-        self.vel_y += GRAVITY
-        self.y += self.vel_y
-        
-        # Platform collision (vertical)
-        on_ground = False
-        for platform in platforms:
-            if self.collision(platform):
-                if self.vel_y > 0:  # Falling
-                    self.y = platform.y - self.height
-                    self.vel_y = 0
-                    self.jumping = False
-                    on_ground = True
-                elif self.vel_y < 0:  # Jumping
-                    self.y = platform.y + platform.height
-                    self.vel_y = 0
+            self.anim_tick += 1
+        
+        # Platform collision and gravity in one compiled pass over the platform rows
+        self.x, self.y, self.vel_y, landed = physics.resolve_platforms(
+            self.x, self.y, self.vel_y, self.width, self.height, dx, GRAVITY,
+            level.platform_rects)
+        if landed:
+            self.jumping = False
         
         # Enemy collision
-        for enemy in enemies:
+        for enemy in level.enemies:
             if enemy.active and self.collision(enemy):
                 if self.vel_y > 0 and self.y < enemy.y:
                     # Stomp enemy
@@ -222,15 +444,14 @@ class Player(Sprite):
                         self.vel_y = -JUMP_STRENGTH * 0.5  # Small death hop
                         sounds.gameover.play()
         
-        # Coin collection
-        for coin in coins[:]:
-            if self.collision(coin):
-                coins.remove(coin)
-                self.coins += 1
-                sounds.coin.play()
-                # Every 10 coins = power up
-                if self.coins % 10 == 0:
-                    self.power_up = True
+        # Coin collection, collected coins are only deactivated
+        collected = level.collect_coins(self.x, self.y, self.width, self.height)
+        if collected:
+            # Every 10 coins = power up
+            if (self.coins + collected) // 10 > self.coins // 10:
+                self.power_up = True
+            self.coins += collected
+            sounds.coin.play()
         
         # Keep player in bounds - trigger death animation
         if self.y > GB_HEIGHT:
@@ -265,82 +486,21 @@ class Player(Sprite):
         
         # Death animation - Mario flips upside down
         if self.dying:
-            # Upside down Mario sprite
-            mario_death = [
-                [0,1,0,0,0,1,0,0],
-                [0,1,0,0,0,1,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,0,1,1,1,0,0,0],
-                [0,2,2,2,2,2,0,0],
-                [0,1,2,2,2,1,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,0,1,1,1,0,0,0]
-            ]
-            
-            # Draw death sprite with rotation effect
+            # Add some rotation offset based on death timer
             angle = (self.death_timer * 10) % 360
-            for y in range(8):
-                for x in range(8):
-                    if mario_death[y][x] > 0:
-                        color = GB_DARK if mario_death[y][x] == 1 else GB_DARKEST
-                        # Add some rotation offset based on death timer
-                        draw_x = x_pos + x + int(math.sin(angle * 0.1) * 2)
-                        draw_y = y_pos + y
-                        if 0 <= draw_x < GB_WIDTH and 0 <= draw_y < GB_HEIGHT:
-                            surface.set_at((draw_x, draw_y), color)
+            surface.blit(MARIO_DEATH_SURF, (x_pos + int(math.sin(angle * 0.1) * 2), y_pos))
             return
         
-        # Normal Mario sprite (8x8 pixels)
-        mario_pixels = [
-            # Frame 1 (standing/walking 1)
-            [
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,1,2,2,2,1,0,0],
-                [0,2,2,2,2,2,0,0],
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,1,0,0,0,1,0,0],
-                [0,1,0,0,0,1,0,0]
-            ],
-            # Frame 2 (walking 2)
-            [
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,1,2,2,2,1,0,0],
-                [0,2,2,2,2,2,0,0],
-                [0,0,1,1,1,0,0,0],
-                [0,1,1,1,1,1,0,0],
-                [0,0,1,0,1,0,0,0],
-                [0,1,0,0,0,1,0,0]
-            ]
-        ]
-        
-        # Select frame
-        frame = int(self.animation_frame) if abs(self.vel_y) < 0.1 else 0
-        pixels = mario_pixels[frame]
-        
-        # Flip if facing left
-        if self.direction < 0:
-            pixels = [row[::-1] for row in pixels]
-        
-        # Draw Mario (with power-up glow effect)
-        for y in range(8):
-            for x in range(8):
-                if pixels[y][x] > 0:
-                    if pixels[y][x] == 1:
-                        color = GB_DARK if not self.power_up else GB_DARKEST
-                    else:
-                        color = GB_DARKEST
-                    if 0 <= x_pos + x < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                        surface.set_at((x_pos + x, y_pos + y), color)
+        # Select frame, flipped if facing left and darker with the power-up
+        frame = (self.anim_tick // 5) & 1 if abs(self.vel_y) < 0.1 else 0
+        surface.blit(MARIO_FRAMES[self.power_up][self.direction][frame], (x_pos, y_pos))
                         
         # Power-up sparkle effect
         if self.power_up and random.random() < 0.3:
             spark_x = x_pos + random.randint(-2, 9)
             spark_y = y_pos + random.randint(-2, 9)
-            if 0 <= spark_x < GB_WIDTH and 0 <= spark_y < GB_HEIGHT:
-                surface.set_at((spark_x, spark_y), GB_LIGHT)
+            # A 1x1 fill is clipped by SDL and, unlike set_at, doesn't lock the surface
+            surface.fill(GB_LIGHT_PIXEL, (spark_x, spark_y, 1, 1))
 
 class Platform:
     def __init__(self, x, y, width, height):
@@ -354,152 +514,47 @@ class Platform:
         y_pos = int(self.y)
         
         # Draw platform with tile pattern
-        for ty in range(0, self.height, 8):
-            for tx in range(0, self.width, 8):
-                self.draw_tile(surface, x_pos + tx, y_pos + ty)
-    
-    def draw_tile(self, surface, x, y):
-        # 8x8 platform tile
-        tile = [
-            [1,1,1,1,1,1,1,1],
-            [1,0,0,0,0,0,0,1],
-            [1,0,1,1,1,1,0,1],
-            [1,0,1,0,0,1,0,1],
-            [1,0,1,0,0,1,0,1],
-            [1,0,1,1,1,1,0,1],
-            [1,0,0,0,0,0,0,1],
-            [1,1,1,1,1,1,1,1]
-        ]
-        
-        for ty in range(8):
-            for tx in range(8):
-                if 0 <= x + tx < GB_WIDTH and 0 <= y + ty < GB_HEIGHT:
-                    color = GB_DARK if tile[ty][tx] == 1 else GB_LIGHT
-                    surface.set_at((x + tx, y + ty), color)
+        surface.blits([(PLATFORM_TILE, (x_pos + tx, y_pos + ty))
+                       for ty in range(0, self.height, 8) for tx in range(0, self.width, 8)],
+                      doreturn=0)
 
 class Enemy:
-    def __init__(self, x, y, enemy_type=0):
-        self.x = x
-        self.y = y
+    """View onto one enemy's row in the level's arrays"""
+    def __init__(self, level, index, enemy_type=0):
+        self.level = level
+        self.index = index
         self.width = 8
         self.height = 8
-        self.direction = -1
-        self.speed = 0.5 + (enemy_type * 0.2)
-        self.active = True
-        self.animation_frame = 0
         self.enemy_type = enemy_type
     
-    def move(self, platforms):
-        if not self.active:
-            return
-            
-        self.x += self.direction * self.speed
-        self.animation_frame += 0.1
-        if self.animation_frame >= 2:
-            self.animation_frame = 0
-        
-        # Change direction at platform edges
-        on_platform = False
-        for platform in platforms:
-            if (self.x + self.width > platform.x and 
-                self.x < platform.x + platform.width and
-                abs((self.y + self.height) - platform.y) < 2):
-                on_platform = True
-                
-                if (self.direction < 0 and self.x <= platform.x) or \
-                   (self.direction > 0 and self.x + self.width >= platform.x + platform.width):
-                    self.direction *= -1
-        
-        if not on_platform:
-            self.direction *= -1
+    @property
+    def x(self):
+        return self.level.enemy_xy[self.index, 0]
     
-    def draw(self, surface, scroll_x):
-        if not self.active:
-            return
-            
-        x_pos = int(self.x - scroll_x)
-        y_pos = int(self.y)
-        
-        if self.enemy_type == 0:
-            # Goomba sprite (8x8)
-            sprite = [
-                [0,0,1,1,1,1,0,0],
-                [0,1,1,1,1,1,1,0],
-                [0,1,0,1,1,0,1,0],
-                [0,1,1,1,1,1,1,0],
-                [0,1,1,0,0,1,1,0],
-                [0,0,1,1,1,1,0,0],
-                [0,1,0,0,0,0,1,0],
-                [1,1,0,0,0,0,1,1]
-            ]
-            
-            # Animate walking
-            if int(self.animation_frame) == 1:
-                sprite[7] = [1,0,1,0,0,1,0,1]
-        else:
-            # Flying enemy sprite
-            sprite = [
-                [0,1,0,0,0,0,1,0],
-                [0,0,1,0,0,1,0,0],
-                [1,1,1,1,1,1,1,1],
-                [1,0,1,1,1,1,0,1],
-                [1,1,1,0,0,1,1,1],
-                [0,1,1,1,1,1,1,0],
-                [0,0,1,0,0,1,0,0],
-                [0,0,0,1,1,0,0,0]
-            ]
-            
-            # Flap wings
-            if int(self.animation_frame) == 1:
-                sprite[2] = [1,0,1,1,1,1,0,1]
-        
-        # Draw enemy
-        for y in range(8):
-            for x in range(8):
-                if sprite[y][x] == 1:
-                    if 0 <= x_pos + x < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                        surface.set_at((x_pos + x, y_pos + y), GB_DARK)
-
-class Coin:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 8
-        self.height = 8
-        self.animation_frame = 0
+    @property
+    def y(self):
+        return self.level.enemy_xy[self.index, 1]
     
-    def draw(self, surface, scroll_x):
+    @property
+    def active(self):
+        return self.level.enemy_active[self.index]
+    
+    @active.setter
+    def active(self, value):
+        self.level.enemy_active[self.index] = value
+    
+    @property
+    def animation_frame(self):
+        # Two frame cycle, 10 ticks per frame
+        return (self.level.enemy_tick[self.index] // 10) & 1
+    
+    def blit_item(self, scroll_x):
+        """Sprite and screen position, for batching into a single blit call"""
         x_pos = int(self.x - scroll_x)
         y_pos = int(self.y)
         
-        self.animation_frame += 0.1
-        
-        # Coin sprite (8x8) with animation
-        coin = [
-            [0,0,1,1,1,1,0,0],
-            [0,1,1,1,1,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,0,0,1,1,0],
-            [0,1,1,1,1,1,1,0],
-            [0,0,1,1,1,1,0,0]
-        ]
-        
-        # Animate (make it spin)
-        if int(self.animation_frame) % 4 == 1:
-            for y in range(8):
-                coin[y] = [0,0,0,1,1,0,0,0]
-        elif int(self.animation_frame) % 4 == 3:
-            for y in range(8):
-                coin[y] = [0,0,0,1,1,0,0,0]
-        
-        # Draw coin
-        for y in range(8):
-            for x in range(8):
-                if coin[y][x] == 1:
-                    if 0 <= x_pos + x < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                        surface.set_at((x_pos + x, y_pos + y), GB_DARKEST)
+        # Goomba walks, flying enemy flaps its wings
+        return ENEMY_FRAMES[self.enemy_type][self.animation_frame], (x_pos, y_pos)
 
 class Goal:
     def __init__(self, x, y):
@@ -516,46 +571,84 @@ class Goal:
         self.animation += 0.1
         
         # Draw flag pole
-        for y in range(32):
-            if 0 <= x_pos + 7 < GB_WIDTH and 0 <= y_pos + y < GB_HEIGHT:
-                surface.set_at((x_pos + 7, y_pos + y), GB_DARKEST)
-                surface.set_at((x_pos + 8, y_pos + y), GB_DARKEST)
+        if 0 <= x_pos + 7 < GB_WIDTH:
+            surface.fill(GB_DARKEST_PIXEL, (x_pos + 7, y_pos, 2, 32))
         
         # Animated flag
         wave = math.sin(self.animation) * 2
-        flag = [
-            [1,1,1,1,1,1,1,0],
-            [1,0,0,0,0,0,1,0],
-            [1,0,0,0,0,0,1,0],
-            [1,1,1,1,1,1,1,0],
-            [0,0,0,0,0,0,0,0]
-        ]
-        
-        for y in range(5):
-            for x in range(8):
-                if flag[y][x] == 1:
-                    fx = x_pos + x + 9 + int(wave * (1 - y/5))
-                    if 0 <= fx < GB_WIDTH and 0 <= y_pos + y + 5 < GB_HEIGHT:
-                        surface.set_at((fx, y_pos + y + 5), GB_DARK)
+        surface.blits([(FLAG_ROWS[y], (x_pos + 9 + int(wave * (1 - y/5)), y_pos + y + 5))
+                       for y in range(5)], doreturn=0)
 
 class Level:
     def __init__(self, level_num):
         self.level_num = level_num
         self.platforms = []
-        self.enemies = []
-        self.coins = []
+        self.enemy_spawns = []  # (x, y, enemy_type)
+        self.coin_spawns = []  # (x, y)
         self.goal = None
         self.level_width = 640 + (level_num * 160)  # Levels get longer
         self.player_start = (20, 100)
         
         self.create_level(level_num)
+        
+        # Coins never move, so they are stored sorted by x and drawing and
+        # collection binary search straight to the ones in range
+        coin_xy = np.array(self.coin_spawns, dtype=np.float64).reshape(-1, 2)
+        self.coin_xy = coin_xy[np.argsort(coin_xy[:, 0], kind="stable")]
+        self.coin_active = np.ones(len(coin_xy), dtype=bool)
+        self.coin_tick = 0  # Every coin spins in step
+        
+        # Platform rows (x, y, width, height) for the physics kernels
+        self.platform_rects = np.array([(p.x, p.y, p.width, p.height) for p in self.platforms],
+                                       dtype=np.float64).reshape(-1, 4)
+        
+        # Enemies live in structure-of-arrays form, one row each, updated in
+        # place by move_enemies. The Enemy objects are views onto their row.
+        spawns = np.array(self.enemy_spawns, dtype=np.float64).reshape(-1, 3)
+        enemy_types = spawns[:, 2].astype(int)
+        self.enemy_xy = spawns[:, :2].copy()
+        self.enemy_dir = np.full(len(spawns), -1, dtype=np.int64)
+        self.enemy_speed = 0.5 + (enemy_types * 0.2)
+        self.enemy_active = np.ones(len(spawns), dtype=bool)
+        self.enemy_tick = np.zeros(len(spawns), dtype=np.int64)
+        self.enemies = [Enemy(self, index, enemy_type) for index, enemy_type in enumerate(enemy_types)]
+        
+        # Platforms never move, so they are rendered once into a level sized
+        # background and draw_game only blits the visible slice
+        self.bg = pygame.Surface((self.level_width, GB_HEIGHT)).convert()
+        self.bg.fill(GB_LIGHTEST)
+        for platform in self.platforms:
+            platform.draw(self.bg, 0)
+    
+    def coin_range(self, left, right):
+        """Slice of the coin rows with left < x < right"""
+        xs = self.coin_xy[:, 0]
+        return slice(np.searchsorted(xs, left, side="right"), np.searchsorted(xs, right, side="left"))
+    
+    def collect_coins(self, x, y, width, height):
+        """Deactivate the active coins overlapping a box, returning how many"""
+        window = self.coin_range(x - 8, x + width)
+        coin_y = self.coin_xy[window, 1]
+        hits = self.coin_active[window] & (coin_y < y + height) & (coin_y + 8 > y)
+        self.coin_active[window] &= ~hits
+        return int(np.count_nonzero(hits))
+    
+    def move_enemies(self):
+        """Walk every active enemy, turning around at the edges of its platform"""
+        physics.step_enemies(self.enemy_xy[:, 0], self.enemy_xy[:, 1], self.enemy_dir, self.enemy_speed,
+                             self.enemy_active, self.enemy_tick, self.platform_rects)
     
     def create_level(self, num):
         # Ground with gaps
         gap_freq = max(1, 6 - num)  # More gaps in later levels
-        for x in range(0, self.level_width, 16):
-            if x % (gap_freq * 16) != 0 or x < 32:
-                self.platforms.append(Platform(x, GB_HEIGHT - 16, 16, 16))
+        ground = [x for x in range(0, self.level_width, 16) if x % (gap_freq * 16) != 0 or x < 32]
+        
+        # Every unbroken run of 16px ground tiles becomes one wide platform
+        run_start = ground[0]
+        for x, next_x in zip(ground, ground[1:] + [None]):
+            if next_x != x + 16:
+                self.platforms.append(Platform(run_start, GB_HEIGHT - 16, x + 16 - run_start, 16))
+                run_start = next_x
         
         if num == 1:
             # Level 1 - Introduction
@@ -564,11 +657,11 @@ class Level:
             self.platforms.append(Platform(200, 100, 40, 8))
             self.platforms.append(Platform(280, 90, 32, 8))
             
-            self.enemies.append(Enemy(100, 92, 0))
-            self.enemies.append(Enemy(220, 92, 0))
+            self.enemy_spawns.append((100, 92, 0))
+            self.enemy_spawns.append((220, 92, 0))
             
             for i in range(5):
-                self.coins.append(Coin(80 + i * 40, 65))
+                self.coin_spawns.append((80 + i * 40, 65))
             
         elif num == 2:
             # Level 2 - Vertical challenge
@@ -576,19 +669,19 @@ class Level:
                 y = 110 - (i % 3) * 20
                 self.platforms.append(Platform(60 + i * 45, y, 30, 8))
                 if i % 2 == 0:
-                    self.enemies.append(Enemy(65 + i * 45, y - 8, 0))
+                    self.enemy_spawns.append((65 + i * 45, y - 8, 0))
             
             for i in range(10):
-                self.coins.append(Coin(70 + i * 35, 50 + (i % 3) * 20))
+                self.coin_spawns.append((70 + i * 35, 50 + (i % 3) * 20))
                 
         elif num == 3:
             # Level 3 - Enemy gauntlet
             for i in range(10):
                 self.platforms.append(Platform(50 + i * 50, 100 - (i % 2) * 30, 35, 8))
-                self.enemies.append(Enemy(55 + i * 50, 92 - (i % 2) * 30, i % 2))
+                self.enemy_spawns.append((55 + i * 50, 92 - (i % 2) * 30, i % 2))
             
             for i in range(15):
-                self.coins.append(Coin(60 + i * 30, 40 + (i % 4) * 15))
+                self.coin_spawns.append((60 + i * 30, 40 + (i % 4) * 15))
         
         elif num == 4:
             # Level 4 - Precision platforming
@@ -596,11 +689,11 @@ class Level:
                 width = 20 + (i % 3) * 5
                 self.platforms.append(Platform(40 + i * 55, 120 - i * 3, width, 8))
                 if i % 3 == 0:
-                    self.enemies.append(Enemy(45 + i * 55, 112 - i * 3, 1))
+                    self.enemy_spawns.append((45 + i * 55, 112 - i * 3, 1))
             
             # Bonus coins in hard to reach places
             for i in range(20):
-                self.coins.append(Coin(50 + i * 35, 30 + math.sin(i * 0.5) * 20))
+                self.coin_spawns.append((50 + i * 35, 30 + math.sin(i * 0.5) * 20))
                 
         elif num == 5:
             # Level 5 - Ultimate challenge
@@ -612,14 +705,14 @@ class Level:
                 
                 # Mixed enemy types
                 enemy_type = 1 if i % 3 == 0 else 0
-                self.enemies.append(Enemy(x + 5, int(y) - 8, enemy_type))
+                self.enemy_spawns.append((x + 5, int(y) - 8, enemy_type))
             
             # Coin spiral
             for i in range(30):
                 angle = i * 0.3
                 x = 300 + math.cos(angle) * (50 + i * 2)
                 y = 70 + math.sin(angle) * 20
-                self.coins.append(Coin(int(x), int(y)))
+                self.coin_spawns.append((int(x), int(y)))
         
         # Goal at end of level
         self.goal = Goal(self.level_width - 40, GB_HEIGHT - 48)
@@ -631,11 +724,19 @@ class Game:
         self.player = None
         self.level = None
         self.scroll_x = 0
-        self.gb_surface = pygame.Surface((GB_WIDTH, GB_HEIGHT))
+        self.gb_surface = pygame.Surface((GB_WIDTH, GB_HEIGHT)).convert()
+        # The scaled frame covers the whole window, presented as one fixed rect
+        self.screen_rect = screen.get_rect()
         self.level_unlocked = [True, False, False, False, False]
         self.frame_count = 0
         self.show_fps = True
         self.clock = pygame.time.Clock()
+        # Keyboard only game, SDL drops every other event before it is queued
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        # Static parts of the menu screens, only the animated pieces are drawn per frame
+        self.title_bg = self.build_title_bg()
+        self.level_select_bgs = {}  # Keyed by which levels are unlocked
         
     def start_level(self, level_num):
         self.current_level = level_num
@@ -649,64 +750,27 @@ class Game:
     
     def draw_text(self, surface, text, x, y, color=GB_DARKEST):
         """Draw pixelated text"""
-        char_width = 4
-        char_map = {
-            'A': [[1,1,1],[1,0,1],[1,1,1],[1,0,1]],
-            'B': [[1,1,0],[1,0,1],[1,1,0],[1,1,1]],
-            'C': [[1,1,1],[1,0,0],[1,0,0],[1,1,1]],
-            'D': [[1,1,0],[1,0,1],[1,0,1],[1,1,0]],
-            'E': [[1,1,1],[1,0,0],[1,1,0],[1,1,1]],
-            'F': [[1,1,1],[1,0,0],[1,1,0],[1,0,0]],
-            'G': [[1,1,1],[1,0,0],[1,0,1],[1,1,1]],
-            'H': [[1,0,1],[1,0,1],[1,1,1],[1,0,1]],
-            'I': [[1,1,1],[0,1,0],[0,1,0],[1,1,1]],
-            'J': [[0,0,1],[0,0,1],[1,0,1],[1,1,1]],
-            'K': [[1,0,1],[1,1,0],[1,1,0],[1,0,1]],
-            'L': [[1,0,0],[1,0,0],[1,0,0],[1,1,1]],
-            'M': [[1,0,1],[1,1,1],[1,0,1],[1,0,1]],
-            'N': [[1,0,1],[1,1,1],[1,1,1],[1,0,1]],
-            'O': [[1,1,1],[1,0,1],[1,0,1],[1,1,1]],
-            'P': [[1,1,1],[1,0,1],[1,1,1],[1,0,0]],
-            'Q': [[1,1,0],[1,0,1],[1,1,0],[0,0,1]],
-            'R': [[1,1,0],[1,0,1],[1,1,0],[1,0,1]],
-            'S': [[1,1,1],[1,0,0],[0,1,0],[1,1,1]],
-            'T': [[1,1,1],[0,1,0],[0,1,0],[0,1,0]],
-            'U': [[1,0,1],[1,0,1],[1,0,1],[1,1,1]],
-            'V': [[1,0,1],[1,0,1],[1,0,1],[0,1,0]],
-            'W': [[1,0,1],[1,0,1],[1,1,1],[1,0,1]],
-            'X': [[1,0,1],[0,1,0],[0,1,0],[1,0,1]],
-            'Y': [[1,0,1],[1,0,1],[0,1,0],[0,1,0]],
-            'Z': [[1,1,1],[0,0,1],[0,1,0],[1,1,1]],
-            '0': [[1,1,1],[1,0,1],[1,0,1],[1,1,1]],
-            '1': [[0,1,0],[1,1,0],[0,1,0],[1,1,1]],
-            '2': [[1,1,1],[0,0,1],[0,1,0],[1,1,1]],
-            '3': [[1,1,1],[0,0,1],[0,1,1],[1,1,1]],
-            '4': [[1,0,1],[1,0,1],[1,1,1],[0,0,1]],
-            '5': [[1,1,1],[1,0,0],[0,1,1],[1,1,0]],
-            '6': [[1,1,1],[1,0,0],[1,1,1],[1,1,1]],
-            ' ': [[0,0,0],[0,0,0],[0,0,0],[0,0,0]],
-            ':': [[0,1,0],[0,0,0],[0,1,0],[0,0,0]],
-            '!': [[0,1,0],[0,1,0],[0,0,0],[0,1,0]],
-        }
-        
-        for i, char in enumerate(text.upper()):
-            if char in char_map:
-                pixels = char_map[char]
-                for cy in range(4):
-                    for cx in range(3):
-                        if pixels[cy][cx] == 1:
-                            if 0 <= x + i*char_width + cx < GB_WIDTH and 0 <= y + cy < GB_HEIGHT:
-                                surface.set_at((x + i*char_width + cx, y + cy), color)
+        surface.blit(render_text(text, color), (x, y))
+    
+    def draw_counter(self, surface, label, value, x, y, color=GB_DARKEST):
+        """Draw a cached label followed by a number, digits come straight from the glyph atlas"""
+        surface.blit(render_text(label, color), (x, y))
+        x += len(label) * 4
+        glyphs = GLYPHS[color]
+        surface.blits([(glyphs[digit], (x + i*4, y))
+                       for i, digit in enumerate(str(value)) if digit in glyphs], doreturn=0)
     
     def run(self):
+        QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+        
         while True:
             # Handle events
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if event.type == QUIT:
                     pygame.quit()
                     sys.exit()
                 
-                if event.type == pygame.KEYDOWN:
+                if event.type == KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         if self.state == "playing":
                             self.state = "menu"
@@ -740,10 +804,8 @@ class Game:
                             self.state = "level_select"
                             sounds.select.play()
             
-            # Clear Game Boy surface
-            self.gb_surface.fill(GB_LIGHTEST)
-            
-            # Game logic and drawing
+            # Game logic and drawing, every screen starts with an opaque
+            # background blit so the frame is never cleared
             if self.state == "playing":
                 keys = pygame.key.get_pressed()
                 dx = 0
@@ -752,11 +814,10 @@ class Game:
                 if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
                     dx = PLAYER_SPEED
                 
-                self.player.move(dx, self.level.platforms, self.level.enemies, self.level.coins)
+                self.player.move(dx, self.level)
                 
                 # Move enemies
-                for enemy in self.level.enemies:
-                    enemy.move(self.level.platforms)
+                self.level.move_enemies()
                 
                 # Camera scrolling
                 if self.player.x - self.scroll_x > GB_WIDTH - SCROLL_THRESH:
@@ -797,22 +858,45 @@ class Game:
                 fps = int(self.clock.get_fps())
                 self.draw_text(self.gb_surface, f"{fps}FPS", GB_WIDTH - 28, 5, GB_DARK)
             
-            # Scale up and display
-            scaled_surface = pygame.transform.scale(self.gb_surface, (WIDTH, HEIGHT))
-            screen.blit(scaled_surface, (0, 0))
+            # Scale up straight into the window, no intermediate frame to copy
+            pygame.transform.scale(self.gb_surface, (WIDTH, HEIGHT), screen)
             
-            pygame.display.flip()
+            pygame.display.update(self.screen_rect)
             self.clock.tick(FPS)
             self.frame_count += 1
     
+    def build_title_bg(self):
+        """Title screen text that never moves"""
+        surface = pygame.Surface((GB_WIDTH, GB_HEIGHT)).convert()
+        surface.fill(GB_LIGHTEST)
+        self.draw_text(surface, "MARIO LAND", 35, 35)
+        self.draw_text(surface, "60FPS TECH DEMO", 25, 50, GB_DARK)
+        self.draw_text(surface, "F1: TOGGLE FPS", 30, 125, GB_DARK)
+        return surface
+    
+    def level_select_bg(self):
+        """Level list with no row highlighted, built once per set of unlocked levels"""
+        key = tuple(self.level_unlocked)
+        if key not in self.level_select_bgs:
+            surface = pygame.Surface((GB_WIDTH, GB_HEIGHT)).convert()
+            surface.fill(GB_LIGHTEST)
+            self.draw_text(surface, "SELECT LEVEL", 35, 10)
+            for i, unlocked in enumerate(self.level_unlocked):
+                y_pos = 30 + i * 20
+                if unlocked:
+                    self.draw_text(surface, f"LEVEL {i+1}", 45, y_pos, GB_DARK)
+                    self.draw_text(surface, f"PRESS {i+1}", 45, y_pos + 8, GB_DARK)
+                else:
+                    self.draw_text(surface, "LOCKED", 45, y_pos, GB_LIGHT)
+            self.level_select_bgs[key] = surface
+        return self.level_select_bgs[key]
+    
     def draw_menu(self):
+        self.gb_surface.blit(self.title_bg, (0, 0))
+        
         # Animated title
         wave = math.sin(self.frame_count * 0.05) * 5
-        
-        # Title with effects
         self.draw_text(self.gb_surface, "ULTRA!", 50, 20 + int(wave))
-        self.draw_text(self.gb_surface, "MARIO LAND", 35, 35)
-        self.draw_text(self.gb_surface, "60FPS TECH DEMO", 25, 50, GB_DARK)
         
         # Instructions
         pulse = abs(math.sin(self.frame_count * 0.03))
@@ -820,91 +904,72 @@ class Game:
             self.draw_text(self.gb_surface, "PRESS ENTER", 38, 90)
         
         # Animated Mario
-        mario_y = 100 + math.sin(self.frame_count * 0.1) * 3
-        mario = [
-            [0,0,1,1,1,0,0,0],
-            [0,1,1,1,1,1,0,0],
-            [0,1,2,2,2,1,0,0],
-            [0,2,2,2,2,2,0,0],
-            [0,0,1,1,1,0,0,0],
-            [0,1,1,1,1,1,0,0],
-            [0,1,0,0,0,1,0,0],
-            [0,1,0,0,0,1,0,0]
-        ]
-        
-        for y in range(8):
-            for x in range(8):
-                if mario[y][x] > 0:
-                    color = GB_DARK if mario[y][x] == 1 else GB_DARKEST
-                    self.gb_surface.set_at((76 + x, int(mario_y) + y), color)
-        
-        # Tech demo info
-        self.draw_text(self.gb_surface, "F1: TOGGLE FPS", 30, 125, GB_DARK)
+        # Whole pixels, flooring the offset matches truncating the (positive) total
+        mario_y = 100 + math.floor(math.sin(self.frame_count * 0.1) * 3)
+        self.gb_surface.blit(MARIO_FRAMES[False][1][0], (76, mario_y))
     
     def draw_level_select(self):
-        self.draw_text(self.gb_surface, "SELECT LEVEL", 35, 10)
-        
-        for i in range(5):
-            y_pos = 30 + i * 20
-            if self.level_unlocked[i]:
-                # Highlight effect on unlocked levels
-                if (self.frame_count // 10) % 5 == i:
-                    color = GB_DARKEST
-                else:
-                    color = GB_DARK
-                    
-                self.draw_text(self.gb_surface, f"LEVEL {i+1}", 45, y_pos, color)
-                self.draw_text(self.gb_surface, f"PRESS {i+1}", 45, y_pos + 8, GB_DARK)
-            else:
-                self.draw_text(self.gb_surface, "LOCKED", 45, y_pos, GB_LIGHT)
+        self.gb_surface.blit(self.level_select_bg(), (0, 0))
+        
+        # Highlight effect cycles through the unlocked levels, the darker
+        # label is drawn straight over the same glyphs on the background
+        highlighted = (self.frame_count // 10) % 5
+        if self.level_unlocked[highlighted]:
+            self.gb_surface.blit(LEVEL_HIGHLIGHTS[highlighted], (45, 30 + highlighted * 20))
     
     def draw_game(self):
-        # Draw platforms
-        for platform in self.level.platforms:
-            platform.draw(self.gb_surface, self.scroll_x)
-        
-        # Draw coins
-        for coin in self.level.coins:
-            coin.draw(self.gb_surface, self.scroll_x)
-        
-        # Draw enemies
-        for enemy in self.level.enemies:
-            enemy.draw(self.gb_surface, self.scroll_x)
+        surface = self.gb_surface
+        scroll_x = self.scroll_x
+        level = self.level
+        player = self.player
+        
+        # Draw platforms, ceil matches the int(x - scroll_x) placement of the sprites
+        surface.blit(level.bg, (0, 0), (math.ceil(scroll_x), 0, GB_WIDTH, GB_HEIGHT))
+        
+        # Draw on-screen coins, then enemies, in one batched call
+        level.coin_tick += 1
+        coin_image = COIN_SPIN_FRAMES[(level.coin_tick // 10) & 3]
+        window = level.coin_range(scroll_x - 8, scroll_x + GB_WIDTH)
+        coin_xy = level.coin_xy[window][level.coin_active[window]]
+        coin_xy[:, 0] -= scroll_x
+        blit_seq = [(coin_image, pos) for pos in map(tuple, coin_xy.astype(int).tolist())]
+        
+        # Enemies move, so they are culled with a mask over their positions instead
+        enemy_xs = level.enemy_xy[:, 0]
+        visible = level.enemy_active & (enemy_xs > scroll_x - 8) & (enemy_xs < scroll_x + GB_WIDTH)
+        enemies = level.enemies
+        blit_seq.extend(enemies[index].blit_item(scroll_x) for index in np.flatnonzero(visible))
+        _blit_batch(surface, blit_seq)
         
         # Draw goal
-        if self.level.goal:
-            self.level.goal.draw(self.gb_surface, self.scroll_x)
+        if level.goal:
+            level.goal.draw(surface, scroll_x)
         
         # Draw player
-        self.player.draw(self.gb_surface, self.scroll_x)
+        player.draw(surface, scroll_x)
         
         # Draw UI with power-up indicator
-        self.draw_text(self.gb_surface, f"L:{self.player.lives}", 5, 5)
-        self.draw_text(self.gb_surface, f"C:{self.player.coins}", 35, 5)
-        self.draw_text(self.gb_surface, f"LV:{self.current_level}", 70, 5)
+        draw_counter = self.draw_counter
+        draw_counter(surface, "L:", player.lives, 5, 5)
+        draw_counter(surface, "C:", player.coins, 35, 5)
+        draw_counter(surface, "LV:", self.current_level, 70, 5)
         
-        if self.player.power_up:
-            self.draw_text(self.gb_surface, "POWER!", 100, 5, GB_DARKEST)
+        if player.power_up:
+            self.draw_text(surface, "POWER!", 100, 5, GB_DARKEST)
     
     def draw_game_over(self):
         # Darken screen with pattern
-        for y in range(GB_HEIGHT):
-            for x in range(GB_WIDTH):
-                if (x + y) % 2 == 0:
-                    self.gb_surface.set_at((x, y), GB_DARK)
+        self.gb_surface.blit(GAME_OVER_OVERLAY, (0, 0))
         
         self.draw_text(self.gb_surface, "GAME OVER", 45, 60)
         self.draw_text(self.gb_surface, "PRESS ENTER", 40, 80)
     
     def draw_victory(self):
-        # Victory animation
-        for y in range(GB_HEIGHT):
-            for x in range(GB_WIDTH):
-                if (x + y + self.frame_count // 2) % 3 == 0:
-                    self.gb_surface.set_at((x, y), GB_LIGHT)
+        # Victory animation, diagonal stripes scrolling every other frame
+        self.gb_surface.blit(VICTORY_OVERLAYS[self.frame_count // 2 % 3], (0, 0))
         
         self.draw_text(self.gb_surface, "LEVEL CLEAR!", 40, 50)
-        self.draw_text(self.gb_surface, f"COINS: {self.player.coins}", 45, 70)
+        self.draw_counter(self.gb_surface, "COINS: ", self.player.coins, 45, 70)
         
         if self.current_level == 5:
             self.draw_text(self.gb_surface, "GAME COMPLETE!", 35, 90)